@@ -5,6 +5,7 @@ Contains all game constants and settings
 """
 
 import pygame
+import pygame.freetype
 
 
 class Config:
@@ -66,6 +67,24 @@ class Config:
         }
         return pygame.font.Font(None, size_map.get(size, cls.FONT_SIZE_MEDIUM))
 
+    @classmethod
+    def get_freetype_font(cls, size="medium"):
+        """Get pygame.freetype font with specified size.
+
+        Uses the same default typeface as get_font; pygame.font shrinks the
+        default font by 0.6875, so the same factor is applied here to keep
+        text the same size on screen.
+        """
+        if not pygame.freetype.get_init():
+            pygame.freetype.init()
+        size_map = {
+            "small": cls.FONT_SIZE_SMALL,
+            "medium": cls.FONT_SIZE_MEDIUM,
+            "large": cls.FONT_SIZE_LARGE,
+        }
+        point_size = size_map.get(size, cls.FONT_SIZE_MEDIUM) * 0.6875
+        return pygame.freetype.Font(None, point_size)
+
     @classmethod
     def screen_to_grid(cls, screen_pos):
         """Convert screen coordinates to grid coordinates"""
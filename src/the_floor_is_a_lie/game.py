@@ -18,6 +18,7 @@ from .score import ScoreSystem
 from .sound_effects import SoundEffects
 from .ui import (
     CONTINUE_TO_NEXT_LEVEL_EVENT,
+    OPEN_EDITOR_EVENT,
     RESTART_FROM_LEVEL_1_EVENT,
     RESTART_GAME_EVENT,
     START_MUSIC_EVENT,
@@ -271,6 +272,10 @@ class Game:
                     elif event.type == CONTINUE_TO_NEXT_LEVEL_EVENT:
                         logger.info("Continuing to next level")
                         self.continue_to_next_level()
+                    elif event.type == OPEN_EDITOR_EVENT:
+                        logger.info("Opening level editor from level clear screen")
+                        self.ui.hide_result_screen()
+                        self.enter_level_editor()
 
             # Update game state
             if self.game_state == "playing":
@@ -318,11 +323,11 @@ class Game:
                 was_active = self.player.mask_active
                 self.player.toggle_mask()
                 mask_status = self.player.get_mask_status()
-                logger.info(f"Mask status after toggle: active={mask_status['active']}")
+                logger.info(f"Mask status after toggle: active={mask_status.active}")
 
                 # If mask was just activated (not deactivated),
                 # increment score counter and play sound
-                if not was_active and mask_status["active"]:
+                if not was_active and mask_status.active:
                     self.score_system.add_mask_use()
                     logger.info(
                         f"Mask use counted - total uses: {self.score_system.mask_uses}"
@@ -535,12 +540,14 @@ class Game:
             else:
                 logger.warning("No player object to render!")
 
-            # Render UI overlays
-            self.ui.render_game_ui(self.screen, self.player, self.score_system)
+            # Render UI overlays (mask status is fetched once and shared)
+            mask_status = self.player.get_mask_status() if self.player else None
+            self.ui.render_game_ui(
+                self.screen, self.player, self.score_system, mask_status
+            )
 
             # Render mask image overlay (if active)
-            if self.player:
-                mask_status = self.player.get_mask_status()
+            if mask_status is not None and mask_status.active:
                 self.ui.render_mask_image(self.screen, mask_status)
 
         elif self.game_state == "dying":
@@ -570,7 +577,8 @@ class Game:
             # Render level clear sprite
             self.ui.render_level_clear_sprite(self.screen)
 
-        # Render UI manager (buttons, dialogs, etc.)
+        # Render the cached static HUD, then the UI manager (buttons, dialogs, etc.)
+        self.ui.render_hud_overlay(self.screen)
         self.ui_manager.draw_ui(self.screen)
 
         pygame.display.flip()
@@ -10,7 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import pygame
 
 from .config import Config
-from .tile import Tile, TileType
+from .tile import SAFE_TILE_TYPES, WALKABLE_TILE_TYPES, Tile, TileType
 
 
 class Level:
@@ -19,7 +19,7 @@ class Level:
     def __init__(self, config: Config):
         self.config = config
         self.name = "Default Level"
-        self.grid: List[List[Tile]] = []
+        self.grid = []
         self.start_pos: Tuple[int, int] = (0, 0)
         self.exit_pos: Tuple[int, int] = (0, 0)
 
@@ -32,6 +32,26 @@ class Level:
         # Level metadata
         self.level_config: Dict[str, Any] = {}
 
+    @property
+    def grid(self) -> List[List[Tile]]:
+        """Tile grid, indexed as grid[y][x]
+
+        Replace the whole grid or use set_tile_type() to change tiles, so the
+        cached tile types stay in sync.
+        """
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: List[List[Tile]]):
+        self._grid = grid
+        # Dimensions and a parallel grid of tile types, so position queries
+        # don't have to go through the Tile objects
+        self._height = len(grid)
+        self._width = len(grid[0]) if grid else 0
+        self._tile_types: List[List[Optional[TileType]]] = [
+            [tile.type if tile is not None else None for tile in row] for row in grid
+        ]
+
     def load_level(self, filename: str) -> bool:
         """Load level from JSON file"""
         try:
@@ -56,7 +76,7 @@ class Level:
 
     def _create_grid_from_data(self, grid_data: List[List[str]]):
         """Create tile grid from level data"""
-        self.grid = []
+        grid = []
 
         for y, row in enumerate(grid_data):
             tile_row = []
@@ -71,7 +91,9 @@ class Level:
 
                 tile_row.append(tile)
 
-            self.grid.append(tile_row)
+            grid.append(tile_row)
+
+        self.grid = grid
 
     def _load_config(self):
         """Load level-specific configuration"""
@@ -91,20 +113,10 @@ class Level:
     def save_level(self, filename: str) -> bool:
         """Save current level to JSON file"""
         try:
-            grid_data = []
-            for row in self.grid:
-                row_data = []
-                for tile in row:
-                    # Convert tile type back to string
-                    tile_str_map = {
-                        TileType.EMPTY: "empty",
-                        TileType.REAL: "real",
-                        TileType.FAKE: "fake",
-                        TileType.START: "start",
-                        TileType.EXIT: "exit",
-                    }
-                    row_data.append(tile_str_map[tile.type])
-                grid_data.append(row_data)
+            # Tile type values are the strings used in the level file
+            grid_data = [
+                [tile_type.value for tile_type in row] for row in self._tile_types
+            ]
 
             level_data = {
                 "name": self.name,
@@ -129,7 +141,7 @@ class Level:
     def is_valid_position(self, grid_pos: Tuple[int, int]) -> bool:
         """Check if grid position is within bounds"""
         x, y = grid_pos
-        return 0 <= x < len(self.grid[0]) and 0 <= y < len(self.grid)
+        return 0 <= x < self._width and 0 <= y < self._height
 
     def get_tile(self, grid_pos: Tuple[int, int]) -> Optional[Tile]:
         """Get tile at grid position"""
@@ -139,29 +151,29 @@ class Level:
         x, y = grid_pos
         return self.grid[y][x]
 
+    def get_tile_type(self, grid_pos: Tuple[int, int]) -> Optional[TileType]:
+        """Get tile type at grid position"""
+        if not self.is_valid_position(grid_pos):
+            return None
+
+        x, y = grid_pos
+        return self._tile_types[y][x]
+
     def is_walkable(self, grid_pos: Tuple[int, int], mask_active: bool = False) -> bool:
         """Check if position is walkable"""
-        tile = self.get_tile(grid_pos)
-        if tile is None:
-            return False
-        return tile.is_walkable(mask_active)
+        return self.get_tile_type(grid_pos) in WALKABLE_TILE_TYPES
 
     def is_safe(self, grid_pos: Tuple[int, int], mask_active: bool = False) -> bool:
         """Check if position is safe (won't cause death)"""
-        tile = self.get_tile(grid_pos)
-        if tile is None:
-            return False
-        return tile.is_safe(mask_active)
+        return self.get_tile_type(grid_pos) in SAFE_TILE_TYPES
 
     def is_empty_tile(self, grid_pos: Tuple[int, int]) -> bool:
         """Check if tile at position is empty (causes death)"""
-        tile = self.get_tile(grid_pos)
-        return tile is not None and tile.type == TileType.EMPTY
+        return self.get_tile_type(grid_pos) == TileType.EMPTY
 
     def is_fake_tile(self, grid_pos: Tuple[int, int]) -> bool:
         """Check if tile at position is fake"""
-        tile = self.get_tile(grid_pos)
-        return tile is not None and tile.type == TileType.FAKE
+        return self.get_tile_type(grid_pos) == TileType.FAKE
 
     def is_exit_tile(self, grid_pos: Tuple[int, int]) -> bool:
         """Check if tile at position is the exit"""
@@ -191,6 +203,7 @@ class Level:
 
         # Create new tile
         self.grid[y][x] = Tile(self.config, tile_type, grid_pos)
+        self._tile_types[y][x] = tile_type
 
     def render(self, screen: pygame.Surface, mask_active: bool = False):
         """Render the entire level"""
@@ -212,11 +225,9 @@ class Level:
 
     def get_level_info(self) -> Dict[str, Any]:
         """Get level information for display"""
-        width = len(self.grid[0]) if self.grid else 0
-        height = len(self.grid)
         return {
             "name": self.name,
-            "dimensions": (width, height),
+            "dimensions": (self._width, self._height),
             "start_pos": self.start_pos,
             "exit_pos": self.exit_pos,
             "mask_duration": self.mask_duration,
@@ -5,7 +5,7 @@ Handles player movement, mask mechanics, and collision detection
 """
 
 from enum import Enum
-from typing import Tuple
+from typing import NamedTuple, Tuple
 
 import pygame
 
@@ -14,6 +14,18 @@ from .config import Config
 from .sound_effects import SoundEffects
 
 
+class MaskStatus(NamedTuple):
+    """Snapshot of the player's mask state for UI display"""
+
+    active: bool
+    timer: float
+    duration: float
+    recharge_timer: float
+    cooldown: float
+    available: bool
+    uses: int
+
+
 class AnimationState(Enum):
     """Animation states for player movement"""
 
@@ -704,17 +716,17 @@ class Player:
             mask_surface.fill(self.config.MASK_OVERLAY_COLOR)
             screen.blit(mask_surface, (0, 0))
 
-    def get_mask_status(self) -> dict:
+    def get_mask_status(self) -> MaskStatus:
         """Get current mask status for UI display"""
-        return {
-            "active": self.mask_active,
-            "timer": self.mask_timer,
-            "duration": self.mask_duration,
-            "recharge_timer": self.mask_recharge_timer,
-            "cooldown": self.mask_cooldown,
-            "available": self.mask_available,
-            "uses": self.mask_uses,
-        }
+        return MaskStatus(
+            self.mask_active,
+            self.mask_timer,
+            self.mask_duration,
+            self.mask_recharge_timer,
+            self.mask_cooldown,
+            self.mask_available,
+            self.mask_uses,
+        )
 
     def start_death_animation(self):
         """Start the death animation sequence"""
@@ -47,7 +47,7 @@ def test_basic_gameplay():
     player.toggle_mask()
     mask_status = player.get_mask_status()
 
-    assert mask_status["active"], "Mask activation failed"
+    assert mask_status.active, "Mask activation failed"
     print("✅ Mask activation works")
 
     # Simulate mask duration (fast-forward by directly setting timer to 0)
@@ -55,9 +55,9 @@ def test_basic_gameplay():
     player.update(0.1)  # Single update to trigger deactivation
 
     mask_status = player.get_mask_status()
-    assert not mask_status[
-        "active"
-    ], f"Mask should have deactivated (timer={mask_status['timer']})"
+    assert (
+        not mask_status.active
+    ), f"Mask should have deactivated (timer={mask_status.timer})"
     print("✅ Mask deactivation works")
 
     # Test tile collision
@@ -23,6 +23,14 @@ class TileType(Enum):
     EXIT = "exit"
 
 
+# Fake tiles are always walkable, but they're deadly; only empty tiles can't
+# be walked on. Neither depends on the mask state.
+WALKABLE_TILE_TYPES = frozenset(
+    {TileType.REAL, TileType.FAKE, TileType.START, TileType.EXIT}
+)
+SAFE_TILE_TYPES = WALKABLE_TILE_TYPES - {TileType.FAKE}
+
+
 class Tile:
     """Individual tile in the game grid"""
 
@@ -93,22 +101,11 @@ class Tile:
 
     def is_walkable(self, mask_active: bool = False) -> bool:
         """Check if tile is walkable given mask state"""
-        if self.type == TileType.EMPTY:
-            return False
-        elif self.type == TileType.REAL:
-            return True
-        elif self.type == TileType.FAKE:
-            # Fake tiles are always walkable, but they're deadly
-            return True
-        elif self.type in [TileType.START, TileType.EXIT]:
-            return True
-        return False
+        return self.type in WALKABLE_TILE_TYPES
 
     def is_safe(self, mask_active: bool = False) -> bool:
         """Check if tile is safe to walk on (won't cause death)"""
-        if self.type == TileType.FAKE:
-            return False  # Fake tiles are always dangerous
-        return self.is_walkable(mask_active)
+        return self.type in SAFE_TILE_TYPES
 
     def get_display_color(self, mask_active: bool = False) -> Tuple[int, int, int]:
         """Get the color to display for this tile"""
@@ -5,14 +5,16 @@ Handles user interface elements, timers, and result screens
 """
 
 import logging
-from typing import Any, Dict
+from math import pi as _PI
+from math import tau as _TAU
+from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 import pygame_gui
 
 from .assets import get_asset_manager
 from .config import Config
-from .player import Player
+from .player import MaskStatus, Player
 from .score import ScoreSystem
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,123 @@ RESTART_GAME_EVENT = pygame.USEREVENT + 100
 RESTART_FROM_LEVEL_1_EVENT = pygame.USEREVENT + 101
 CONTINUE_TO_NEXT_LEVEL_EVENT = pygame.USEREVENT + 102
 START_MUSIC_EVENT = pygame.USEREVENT + 103
+OPEN_EDITOR_EVENT = pygame.USEREVENT + 104
+
+# Seconds between HUD label refreshes
+HUD_UPDATE_INTERVAL = 0.1
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display's pixel format when a display is set
+
+    Matching the screen format keeps blits on SDL's fast path. Without a
+    display (e.g. headless tests) the surface is returned unchanged instead of
+    raising.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+# One sixth of the color cycle, the length of each color transition
+_PI_3 = _PI / 3
+
+
+def _neon_color(cycle_position: float) -> Tuple[int, int, int]:
+    """Color for a position in the 0 to 2π 'Push The Any Key' color cycle"""
+    # Cycle through neon colors: cyan -> pink -> magenta -> green
+    # Use sine waves to create smooth color transitions
+    # Cyan to Pink: R increases, G stays high, B decreases
+    # Pink to Magenta: R stays high, G decreases, B increases slightly
+    # Magenta to Green: R decreases, G increases, B decreases
+    # Green to Yellow: R increases, G stays high, B stays low
+    # Yellow to Blue: R decreases, G decreases, B increases
+    # Blue to Cyan: R stays low, G increases, B stays high
+
+    # Simplified approach: cycle through primary neon colors
+    if cycle_position < _PI_3:  # Cyan to Pink
+        t = cycle_position / _PI_3
+        r = int(255 * t)  # 0 -> 255
+        g = 255
+        b = int(255 * (1 - t))  # 255 -> 0
+    elif cycle_position < 2 * _PI_3:  # Pink to Magenta
+        t = (cycle_position - _PI_3) / _PI_3
+        r = 255
+        g = int(255 * (1 - t))  # 255 -> 0
+        b = int(255 * t)  # 0 -> 255
+    elif cycle_position < 3 * _PI_3:  # Magenta to Green
+        t = (cycle_position - 2 * _PI_3) / _PI_3
+        r = int(255 * (1 - t))  # 255 -> 0
+        g = int(255 * t)  # 0 -> 255
+        b = 255
+    elif cycle_position < 4 * _PI_3:  # Green to Yellow
+        t = (cycle_position - 3 * _PI_3) / _PI_3
+        r = int(255 * t)  # 0 -> 255
+        g = 255
+        b = int(255 * (1 - t))  # 255 -> 0
+    elif cycle_position < 5 * _PI_3:  # Yellow to Blue
+        t = (cycle_position - 4 * _PI_3) / _PI_3
+        r = int(255 * (1 - t))  # 255 -> 0
+        g = int(255 * (1 - t))  # 255 -> 0
+        b = 255
+    else:  # Blue to Cyan
+        t = (cycle_position - 5 * _PI_3) / _PI_3
+        r = 0
+        g = int(255 * t)  # 0 -> 255
+        b = 255
+
+    return (r, g, b)
+
+
+# The color cycle sampled at _COLOR_LUT_SIZE evenly spaced positions, so the
+# per-frame update is a single table lookup
+_COLOR_LUT_SIZE = 512
+_COLOR_LUT_SCALE = _COLOR_LUT_SIZE / _TAU
+_COLOR_LUT = [_neon_color(i / _COLOR_LUT_SCALE) for i in range(_COLOR_LUT_SIZE)]
+
+# The cycle position is kept as fixed-point ticks, 2**16 per full cycle; the
+# top bits of a tick count are its table index
+_COLOR_CYCLE_TICKS = 1 << 16
+_COLOR_CYCLE_TICK_MASK = _COLOR_CYCLE_TICKS - 1
+_COLOR_TICK_SHIFT = 7  # 2**16 ticks >> 7 == 512 table entries
+_COLOR_TICKS_PER_RADIAN = _COLOR_CYCLE_TICKS / _TAU
+
+
+# Fully transparent button backgrounds, shared between buttons of the same size
+_TRANSPARENT_BG: Dict[Tuple[int, int], pygame.Surface] = {}
+
+# Star sprite scaled to a text height, keyed by that height. Kept at module
+# level because Game.initialize_game builds a new UI for every level attempt
+_SCALED_STAR_CACHE: Dict[int, pygame.Surface] = {}
+
+
+def _make_transparent(button: pygame_gui.elements.UIButton):
+    """Make a button transparent by overriding all of its appearance"""
+    # Reuse a fully transparent surface for the button background
+    size = (button.rect.width, button.rect.height)
+    transparent_bg = _TRANSPARENT_BG.get(size)
+    if transparent_bg is None:
+        transparent_bg = pygame.Surface(size, pygame.SRCALPHA)
+        transparent_bg.fill((0, 0, 0, 0))
+        _TRANSPARENT_BG[size] = transparent_bg
+    button.set_image(transparent_bg)
+
+    # Override text color to white
+    button.text_colour = pygame.Color(255, 255, 255, 255)
+
+    # Disable the default button appearance completely
+    button.shape = "rectangle"
+    button.colours = button.colours.copy()
+    # Set all background colors to transparent
+    for key in button.colours:
+        if "bg" in key:
+            button.colours[key] = pygame.Color(0, 0, 0, 0)
+        elif "border" in key:
+            button.colours[key] = pygame.Color(0, 0, 0, 0)
+        elif "text" in key:
+            button.colours[key] = pygame.Color(255, 255, 255, 255)
+
+    button.rebuild()
 
 
 class MaskTextController:
@@ -42,29 +161,52 @@ class MaskTextController:
         self.ui_label = ui_label
         self._current_text = "Mask: Ready"
         self._last_state = "ready"
+        self._last_key = ("ready", 0)
+
+        # Formatted strings keyed by (state, tenths of a second)
+        self._text_cache: Dict[tuple, str] = {}
 
-    def update_from_mask_status(self, mask_status: dict) -> None:
+    def update_from_mask_status(self, mask_status: MaskStatus) -> None:
         """
         Update the mask text based on mask status.
 
         Args:
-            mask_status: Dictionary containing mask state information:
+            mask_status: MaskStatus snapshot; the fields used are:
                 - active (bool): Whether mask is currently active
                 - timer (float): Remaining time for active mask
                 - available (bool): Whether mask is ready to use
                 - recharge_timer (float): Remaining cooldown time
         """
-        # Determine current state and text
-        if mask_status["active"]:
-            new_text = f"Mask: Active ({mask_status['timer']:.1f}s)"
-        elif not mask_status["available"]:
-            new_text = f"Mask: Recharging ({mask_status['recharge_timer']:.1f}s)"
+        # Quantize to the displayed precision (one decimal, rounded)
+        if mask_status.active:
+            key = ("active", int(mask_status.timer * 10 + 0.5))
+        elif not mask_status.available:
+            key = ("recharging", int(mask_status.recharge_timer * 10 + 0.5))
         else:
-            new_text = "Mask: Ready"
+            key = ("ready", 0)
 
-        # Simply set the text - pygame_gui should handle it
-        self.ui_label.set_text(new_text)
-        self._current_text = new_text
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._last_state = key[0]
+
+        new_text = self._text_cache.get(key)
+        if new_text is None:
+            if len(self._text_cache) > 1024:
+                self._text_cache.clear()
+            state, tenths = key
+            if state == "active":
+                new_text = f"Mask: Active ({tenths / 10:.1f}s)"
+            elif state == "recharging":
+                new_text = f"Mask: Recharging ({tenths / 10:.1f}s)"
+            else:
+                new_text = "Mask: Ready"
+            self._text_cache[key] = new_text
+
+        # set_text re-renders the label, so only call it when the text changes
+        if new_text != self._current_text:
+            self.ui_label.set_text(new_text)
+            self._current_text = new_text
 
     def get_current_text(self) -> str:
         """
@@ -80,6 +222,7 @@ class MaskTextController:
         self.ui_label.set_text("Mask: Ready")
         self._current_text = "Mask: Ready"
         self._last_state = "ready"
+        self._last_key = ("ready", 0)
 
 
 class UI:
@@ -95,6 +238,12 @@ class UI:
         self.time_text = None
         self.mask_uses_text = None
 
+        # Last values pushed to the labels (None forces the first update)
+        self._last_time_seconds = None
+        self._last_mask_uses = None
+        # Time since the labels were last refreshed; starts due
+        self._ui_accum = HUD_UPDATE_INTERVAL
+
         # Mask text controller (initialized after UI elements are created)
         self.mask_text_controller = None
 
@@ -107,6 +256,10 @@ class UI:
         self.editor_button = None
         self.continue_button = None
 
+        # Result screen buttons, created the first time their screen is shown
+        self._win_buttons: List[pygame_gui.elements.UIButton] = []
+        self._game_over_buttons: List[pygame_gui.elements.UIButton] = []
+
         # Sprites for result screens
         self.game_over_sprite = None
         self.game_over_sprite_loaded = False
@@ -116,78 +269,65 @@ class UI:
         self.star_sprite_loaded = False
         self.main_menu_sprite = None
         self.main_menu_sprite_loaded = False
+        # Main menu layout, computed on first render
+        self._main_menu_pos = None
+        self._main_menu_prompt_pos = (0, 0)
+
+        # Result screen layout while a result screen is shown
+        self.game_over_sprite_rect = None
+        self.level_clear_sprite_rect = None
+        self.press_key_position = None
 
         # Level clear text elements
         self.level_clear_texts = []
 
         # Color cycling for "Push The Any Key" text
-        self.color_cycle_time = 0.0
+        self.color_cycle_ticks = 0  # Fixed-point position in the cycle
         self.color_cycle_speed = 2.0  # Speed of color transition
         self.current_color = (0, 255, 255)  # Start with cyan
+        # freetype renders straight onto the screen, no per-frame text surface
+        self.press_key_font = self.config.get_freetype_font("medium")
+
+        # Rendered debug rows keyed by their text
+        self._debug_text_cache: Dict[str, pygame.Surface] = {}
+        self._debug_row_positions: List[Tuple[int, int]] = []
 
         # Mask image for display
         self.mask_image = None
         self.mask_image_loaded = False
         self.small_mask_icon = None
         self.mask_icon_loaded = False
+        self.large_mask_scaled = None
+        self._mask_blit_pos = (0, 0)
+        self._last_mask_alpha = -1
 
         # Initialize UI elements
         self.create_ui_elements()
-        self.load_sprites_from_asset_manager()
+
+        # Static HUD layout (same position as mask_timer_text)
+        self._mask_icon_text_x = self.config.SCREEN_WIDTH - 210
+        self._mask_icon_text_y = 40
+        self._mask_icon_pos = (self._mask_icon_text_x - 20, self._mask_icon_text_y)
+
+        # The mask is used during gameplay, so its scaling is done here rather
+        # than in the first gameplay frame; the other sprites are loaded on
+        # first use by the menu and result screen methods
+        self._result_sprites_requested = False
+        self._main_menu_sprite_requested = False
+        self.load_mask_image()
 
     def update_color_cycle(self, delta_time: float):
         """Update the color cycling for the 'Push The Any Key' text"""
-        import math
-
-        self.color_cycle_time += delta_time * self.color_cycle_speed
-
-        # Cycle through neon colors: cyan -> pink -> magenta -> green
-        cycle_position = self.color_cycle_time % (2 * math.pi)  # 0 to 2π
-
-        # Use sine waves to create smooth color transitions
-        # Cyan to Pink: R increases, G stays high, B decreases
-        # Pink to Magenta: R stays high, G decreases, B increases slightly
-        # Magenta to Green: R decreases, G increases, B decreases
-        # Green to Yellow: R increases, G stays high, B stays low
-        # Yellow to Blue: R decreases, G decreases, B increases
-        # Blue to Cyan: R stays low, G increases, B stays high
-
-        # Simplified approach: cycle through primary neon colors
-        if cycle_position < math.pi / 3:  # Cyan to Pink
-            t = cycle_position / (math.pi / 3)
-            r = int(255 * t)  # 0 -> 255
-            g = 255
-            b = int(255 * (1 - t))  # 255 -> 0
-        elif cycle_position < 2 * math.pi / 3:  # Pink to Magenta
-            t = (cycle_position - math.pi / 3) / (math.pi / 3)
-            r = 255
-            g = int(255 * (1 - t))  # 255 -> 0
-            b = int(255 * t)  # 0 -> 255
-        elif cycle_position < math.pi:  # Magenta to Green
-            t = (cycle_position - 2 * math.pi / 3) / (math.pi / 3)
-            r = int(255 * (1 - t))  # 255 -> 0
-            g = int(255 * t)  # 0 -> 255
-            b = 255
-        elif cycle_position < 4 * math.pi / 3:  # Green to Yellow
-            t = (cycle_position - math.pi) / (math.pi / 3)
-            r = int(255 * t)  # 0 -> 255
-            g = 255
-            b = int(255 * (1 - t))  # 255 -> 0
-        elif cycle_position < 5 * math.pi / 3:  # Yellow to Blue
-            t = (cycle_position - 4 * math.pi / 3) / (math.pi / 3)
-            r = int(255 * (1 - t))  # 255 -> 0
-            g = int(255 * (1 - t))  # 255 -> 0
-            b = 255
-        else:  # Blue to Cyan
-            t = (cycle_position - 5 * math.pi / 3) / (math.pi / 3)
-            r = 0
-            g = int(255 * t)  # 0 -> 255
-            b = 255
-
-        self.current_color = (r, g, b)
-
-    def load_sprites_from_asset_manager(self):
-        """Load all UI sprites from the asset manager."""
+        step = int(delta_time * self.color_cycle_speed * _COLOR_TICKS_PER_RADIAN + 0.5)
+        ticks = (self.color_cycle_ticks + step) & _COLOR_CYCLE_TICK_MASK
+        self.color_cycle_ticks = ticks
+        self.current_color = _COLOR_LUT[ticks >> _COLOR_TICK_SHIFT]
+
+        # Also drives the HUD label refresh cadence in render_game_ui
+        self._ui_accum += delta_time
+
+    def load_mask_image(self):
+        """Load the mask image and build its icon and full-screen copies"""
         asset_manager = get_asset_manager()
 
         # Load mask image and create small icon
@@ -205,15 +345,60 @@ class UI:
             scaled_width = int(img_width * scale_factor)
             scaled_height = int(img_height * scale_factor)
 
-            self.small_mask_icon = pygame.transform.scale(
-                self.mask_image, (scaled_width, scaled_height)
+            # Nearest-neighbour is plenty for a 64px icon
+            self.small_mask_icon = _to_display_format(
+                pygame.transform.scale(self.mask_image, (scaled_width, scaled_height))
             )
             self.mask_icon_loaded = True
+
+            # Icon sits 20 pixels left of the mask text, centered vertically
+            # on the ~30px text line
+            self._mask_icon_pos = (
+                self._mask_icon_text_x - 20,
+                self._mask_icon_text_y + (30 - self.small_mask_icon.get_height()) // 2,
+            )
+
+            # Pre-scale the full-screen version once, maintaining aspect ratio.
+            # This only runs at load, so the filtered smoothscale is affordable
+            screen_width = self.config.SCREEN_WIDTH
+            screen_height = self.config.SCREEN_HEIGHT
+            scale_factor = min(screen_width / img_width, screen_height / img_height)
+            scaled_width = int(img_width * scale_factor)
+            scaled_height = int(img_height * scale_factor)
+
+            scaled = pygame.transform.smoothscale(
+                self.mask_image, (scaled_width, scaled_height)
+            )
+
+            # Only pixels with alpha 255 are set in a threshold-254 mask
+            opaque_pixels = pygame.mask.from_surface(self.mask_image, 254).count()
+            is_opaque = opaque_pixels == img_width * img_height
+
+            # Keep only the copy that gets blitted. An opaque image needs no
+            # per-pixel alpha: a 24-bit copy faded with set_alpha takes SDL's
+            # SIMD path for blits onto the opaque screen
+            self.large_mask_scaled = _to_display_format(scaled, alpha=not is_opaque)
+
+            # Center the image on screen
+            self._mask_blit_pos = (
+                (screen_width - scaled_width) // 2,
+                (screen_height - scaled_height) // 2,
+            )
             logger.debug("Mask image and icon loaded from asset manager")
         else:
             self.mask_icon_loaded = False
             logger.warning("Failed to load mask image from asset manager")
 
+    def load_result_sprites(self):
+        """Load the win/game over sprites
+
+        Runs once, on first use; later calls return immediately.
+        """
+        if self._result_sprites_requested:
+            return
+        self._result_sprites_requested = True
+        asset_manager = get_asset_manager()
+
         # Load game over sprite
         self.game_over_sprite = asset_manager.get_sprite("game_over_menu")
         self.game_over_sprite_loaded = self.game_over_sprite is not None
@@ -227,16 +412,33 @@ class UI:
             logger.warning("Failed to load level clear sprite from asset manager")
 
         # Load star sprite
-        self.star_sprite = asset_manager.get_sprite("star")
-        if self.star_sprite:
-            # Set black as transparent color in case alpha channel isn't properly set
-            self.star_sprite.set_colorkey((0, 0, 0))
+        star_sprite = asset_manager.get_sprite("star")
+        if star_sprite:
+            # Make black transparent in case alpha channel isn't properly set.
+            # This is baked into a per-pixel alpha copy rather than set as a
+            # colorkey on the shared asset, so star blits stay on the alpha path
+            keyed = star_sprite.copy()
+            keyed.set_colorkey((0, 0, 0))
+            black = pygame.mask.from_surface(keyed)  # Set where not colorkey
+            black.invert()
+            self.star_sprite = star_sprite.copy()
+            black.to_surface(self.star_sprite, setcolor=(0, 0, 0, 0), unsetcolor=None)
             self.star_sprite_loaded = True
             logger.debug("Star sprite loaded from asset manager")
         else:
             self.star_sprite_loaded = False
             logger.warning("Failed to load star sprite from asset manager")
 
+    def load_main_menu_sprite(self):
+        """Load the main menu sprite
+
+        Runs once, on first use; later calls return immediately.
+        """
+        if self._main_menu_sprite_requested:
+            return
+        self._main_menu_sprite_requested = True
+        asset_manager = get_asset_manager()
+
         # Load main menu sprite
         self.main_menu_sprite = asset_manager.get_sprite("main_menu")
         self.main_menu_sprite_loaded = self.main_menu_sprite is not None
@@ -269,9 +471,13 @@ class UI:
             manager=self.ui_manager,
         )
 
+        # Static HUD (instructions) is rasterized once into a cached overlay
+        self._build_hud_overlay()
+
+    def _build_hud_overlay(self):
+        """Rasterize the static HUD elements into a single cached surface"""
         # Instructions (bottom)
-        # Note: not stored as we don't need to update it
-        pygame_gui.elements.UILabel(
+        instructions = pygame_gui.elements.UILabel(
             relative_rect=pygame.Rect(
                 (10, self.config.SCREEN_HEIGHT - 60),
                 (self.config.SCREEN_WIDTH - 20, 50),
@@ -279,134 +485,168 @@ class UI:
             text="M: Mask | B: Music | U: Mute Music | S: Mute SFX | Arrows: Move",
             manager=self.ui_manager,
         )
+        # Let pygame_gui finish building the label image before taking a copy
+        instructions.update(0.0)
+
+        self._hud_overlay = instructions.image.copy()
+        self._hud_overlay_rect = instructions.rect.copy()
+        self._hud_dirty = False
+
+        # The overlay replaces the live element, so the manager stops drawing it
+        instructions.kill()
+
+    def mark_hud_dirty(self):
+        """Flag the cached static HUD overlay for re-rasterization"""
+        self._hud_dirty = True
+
+    def render_hud_overlay(self, screen: pygame.Surface):
+        """Render the cached static HUD overlay"""
+        if self._hud_dirty:
+            self._build_hud_overlay()
+        screen.blit(self._hud_overlay, self._hud_overlay_rect)
 
     def render_game_ui(
-        self, screen: pygame.Surface, player: Player, score_system: ScoreSystem
+        self,
+        screen: pygame.Surface,
+        player: Player,
+        score_system: ScoreSystem,
+        mask_status: Optional[MaskStatus] = None,
     ):
-        """Render game UI elements"""
-        mask_status = player.get_mask_status()
-        stats = score_system.get_current_stats()
+        """Render game UI elements
 
-        # Update mask timer display using the isolated controller
-        self.mask_text_controller.update_from_mask_status(mask_status)
+        Args:
+            mask_status: Mask status already fetched this frame; read from
+                the player if omitted
+        """
+        if mask_status is None:
+            mask_status = player.get_mask_status()
 
         # Render mask icon if available and loaded
-        if mask_status["available"] and self.mask_icon_loaded:
-            # Position icon to the left of the mask timer text
-            text_x = (
-                self.config.SCREEN_WIDTH - 210
-            )  # Same x position as mask_timer_text
-            text_y = 40  # Same y position as mask_timer_text
+        if mask_status.available and self.mask_icon_loaded:
+            screen.blit(self.small_mask_icon, self._mask_icon_pos)
 
-            # Position icon 20 pixels to the left of the text, centered vertically
-            icon_x = text_x - 20
-            icon_y = (
-                text_y + (30 - self.small_mask_icon.get_height()) // 2
-            )  # 30 is approximate text height
+        # The labels show at most tenths of a second, so refresh them at most
+        # every HUD_UPDATE_INTERVAL instead of every frame
+        if self._ui_accum < HUD_UPDATE_INTERVAL:
+            return
+        # Keep the phase but drop any backlog (e.g. time spent in the menu)
+        self._ui_accum %= HUD_UPDATE_INTERVAL
 
-            screen.blit(self.small_mask_icon, (icon_x, icon_y))
+        # Update mask timer display using the isolated controller
+        self.mask_text_controller.update_from_mask_status(mask_status)
 
-        # Update time display
-        time_str = score_system.get_time_formatted()
-        self.time_text.set_text(f"Time: {time_str}")
+        # Update time display; it shows whole seconds, so only reformat when
+        # the second changes
+        seconds = int(score_system.elapsed_time)
+        if seconds != self._last_time_seconds:
+            self._last_time_seconds = seconds
+            time_str = score_system.get_time_formatted(seconds)
+            self.time_text.set_text(f"Time: {time_str}")
 
         # Update mask uses
-        self.mask_uses_text.set_text(f"Mask Uses: {stats['mask_uses']}")
+        mask_uses = score_system.mask_uses
+        if mask_uses != self._last_mask_uses:
+            self._last_mask_uses = mask_uses
+            self.mask_uses_text.set_text(f"Mask Uses: {mask_uses}")
 
-    def render_mask_image(self, screen: pygame.Surface, mask_status: dict):
+    def render_mask_image(self, screen: pygame.Surface, mask_status: MaskStatus):
         """Render the mask image for the first half of mask duration"""
-        if not self.mask_image_loaded or not mask_status["active"]:
+        if not self.mask_image_loaded or not mask_status.active:
             return
 
         # Only show mask image for first half of mask duration
-        remaining_time = mask_status["timer"]
-        total_duration = mask_status["duration"]
-        half_duration = total_duration / 2
-
-        if remaining_time <= half_duration:
+        timer = mask_status.timer
+        half = mask_status.duration * 0.5
+        if timer <= half:
             return
 
-        # Calculate fade opacity for the remaining half-duration
-        time_in_display_period = remaining_time - half_duration
-        fade_ratio = (
-            time_in_display_period / half_duration
-        )  # 1.0 at start of display, 0.0 at end
-        alpha = int(255 * fade_ratio)
-
-        # Create a copy of the image with alpha
-        mask_image_with_alpha = self.mask_image.copy()
-        mask_image_with_alpha.set_alpha(alpha)
-
-        # Calculate scaled size maintaining aspect ratio
-        img_width = self.mask_image.get_width()
-        img_height = self.mask_image.get_height()
-        screen_width = self.config.SCREEN_WIDTH
-        screen_height = self.config.SCREEN_HEIGHT
-
-        # Scale to fit screen while maintaining aspect ratio
-        scale_factor = min(screen_width / img_width, screen_height / img_height)
-        scaled_width = int(img_width * scale_factor)
-        scaled_height = int(img_height * scale_factor)
-
-        # Scale the image
-        if scale_factor != 1.0:
-            scaled_image = pygame.transform.scale(
-                mask_image_with_alpha, (scaled_width, scaled_height)
-            )
-        else:
-            scaled_image = mask_image_with_alpha
+        # Fade out over the remaining half-duration (1.0 at start, 0.0 at end)
+        alpha = int(255 * (timer - half) / half)
 
-        # Center the image on screen
-        x = (screen_width - scaled_width) // 2
-        y = (screen_height - scaled_height) // 2
-
-        # Render the image
-        screen.blit(scaled_image, (x, y))
+        # The surface-wide alpha scales any per-pixel alpha of the cached
+        # surface, so the fade needs no per-frame pixel work. Alpha is 8-bit,
+        # so consecutive frames often land on the same value and can skip
+        # updating the surface
+        if alpha != self._last_mask_alpha:
+            self.large_mask_scaled.set_alpha(alpha)
+            self._last_mask_alpha = alpha
+        screen.blit(self.large_mask_scaled, self._mask_blit_pos)
 
     def render_game_over_sprite(self, screen: pygame.Surface):
         """Render the game over sprite"""
-        if self.game_over_sprite_loaded and hasattr(self, "game_over_sprite_rect"):
+        if self.game_over_sprite_loaded and self.game_over_sprite_rect is not None:
             screen.blit(self.game_over_sprite, self.game_over_sprite_rect)
 
     def render_level_clear_sprite(self, screen: pygame.Surface):
         """Render the level clear sprite and overlaid text/sprite elements"""
-        if self.level_clear_sprite_loaded and hasattr(self, "level_clear_sprite_rect"):
+        if self.level_clear_sprite_loaded and self.level_clear_sprite_rect is not None:
             screen.blit(self.level_clear_sprite, self.level_clear_sprite_rect)
 
-            # Render overlaid text and sprite elements (excluding dynamic text)
-            for element, position in self.level_clear_texts:
-                screen.blit(element, position)
+            # Render overlaid text and sprite elements (excluding dynamic text);
+            # level_clear_texts is already a (surface, position) blit sequence
+            screen.blits(self.level_clear_texts, doreturn=0)
 
             # Render dynamic "Push The Any Key" text with cycling colors
-            if hasattr(self, "press_key_position"):
-                small_font = self.config.get_font("medium")
-                press_key_text = small_font.render(
-                    "Push The Any Key", True, self.current_color
+            if self.press_key_position is not None:
+                self.press_key_font.render_to(
+                    screen,
+                    self.press_key_position,
+                    "Push The Any Key",
+                    fgcolor=self.current_color,
                 )
-                screen.blit(press_key_text, self.press_key_position)
 
     def render_main_menu(self, screen: pygame.Surface):
         """Render the main menu sprite and 'Push Any Key' text"""
+        if self._main_menu_pos is None:
+            self._layout_main_menu()
+
+        if self.main_menu_sprite_loaded:
+            screen.blit(self.main_menu_sprite, self._main_menu_pos)
+
+        # Render "Push Any Key" text with cycling colors in the center bottom
+        self.press_key_font.render_to(
+            screen,
+            self._main_menu_prompt_pos,
+            "Push Any Key",
+            fgcolor=self.current_color,
+        )
+
+    def _layout_main_menu(self):
+        """Compute the fixed main menu sprite and prompt positions"""
+        self.load_main_menu_sprite()
+
+        # Center the sprite on screen
         if self.main_menu_sprite_loaded:
-            # Center the sprite on screen
             sprite_x = (
                 self.config.SCREEN_WIDTH // 2 - self.main_menu_sprite.get_width() // 2
             )
             sprite_y = (
                 self.config.SCREEN_HEIGHT // 2 - self.main_menu_sprite.get_height() // 2
             )
-            screen.blit(self.main_menu_sprite, (sprite_x, sprite_y))
+            self._main_menu_pos = (sprite_x, sprite_y)
+        else:
+            self._main_menu_pos = (0, 0)
 
-        # Render "Push Any Key" text with cycling colors in the center bottom
-        medium_font = self.config.get_font("medium")
-        press_key_text = medium_font.render("Push Any Key", True, self.current_color)
-        text_x = self.config.SCREEN_WIDTH // 2 - press_key_text.get_width() // 2
+        text_rect = self.press_key_font.get_rect("Push Any Key")
+        text_x = self.config.SCREEN_WIDTH // 2 - text_rect.width // 2
         text_y = self.config.SCREEN_HEIGHT - 275  # Position 175 pixels up from bottom
-        screen.blit(press_key_text, (text_x, text_y))
+        self._main_menu_prompt_pos = (text_x, text_y)
 
-    def show_win_screen(self, score_system: ScoreSystem):
-        """Show victory screen with level clear sprite and overlaid text"""
-        score_summary = score_system.get_score_summary()
+    def _make_result_button(self, position, size, text):
+        """Create a transparent result screen button, hidden until shown"""
+        button = pygame_gui.elements.UIButton(
+            relative_rect=pygame.Rect(position, size),
+            text=text,
+            manager=self.ui_manager,
+        )
+        _make_transparent(button)
+        button.hide()
+        return button
+
+    def _build_win_buttons(self):
+        """Lay out the win screen and create its buttons on first show"""
+        if self._win_buttons:
+            return
 
         # Position sprite in center of screen
         sprite_x = (
@@ -415,135 +655,46 @@ class UI:
         sprite_y = (
             self.config.SCREEN_HEIGHT // 2 - self.level_clear_sprite.get_height() // 2
         )
-        self.level_clear_sprite_rect = pygame.Rect(
+        self._level_clear_rect = pygame.Rect(
             sprite_x,
             sprite_y,
             self.level_clear_sprite.get_width(),
             self.level_clear_sprite.get_height(),
         )
 
-        # Create text surfaces for overlay
-        self.level_clear_texts = []
-
-        # Score details - position them in the middle of the sprite
-        small_font = self.config.get_font("medium")
-        details = [
-            f"Time: {score_summary['time']}",
-            f"Mask Uses: {score_summary['mask_uses']}",
-            f"Rating: {score_summary['rating']}",
-        ]
-
-        text_y = sprite_y + self.level_clear_sprite.get_height() // 2 - 40
-
-        # Add time and mask uses as text
-        for detail in details:
-            detail_text = small_font.render(detail, True, (255, 255, 255))
-            detail_x = self.config.SCREEN_WIDTH // 2 - detail_text.get_width() // 2
-            self.level_clear_texts.append((detail_text, (detail_x, text_y)))
-            text_y += 35
-
-        # Add stars with "Stars:" label
-        if self.star_sprite_loaded and score_summary["stars_count"] > 0:
-            # Render "Stars:" text
-            stars_label = small_font.render("Stars:", True, (255, 255, 255))
-            label_x = self.config.SCREEN_WIDTH // 2 - stars_label.get_width() // 2 - 50
-            self.level_clear_texts.append((stars_label, (label_x, text_y)))
-
-            # Calculate star size to match text height
-            text_height = small_font.get_height()
-            star_width = self.star_sprite.get_width()
-            star_height = self.star_sprite.get_height()
-
-            # Scale to match text height while maintaining aspect ratio
-            scale_factor = text_height / star_height
-            scaled_star_width = int(star_width * scale_factor)
-            scaled_star_height = text_height
-
-            # Create transparent star surface to ensure background is transparent
-            scaled_star = pygame.transform.scale(
-                self.star_sprite, (scaled_star_width, scaled_star_height)
-            )
-            # Ensure the scaled surface maintains transparency
-            scaled_star.set_colorkey((0, 0, 0))
-
-            # Position stars to the right of the label
-            label_end_x = label_x + stars_label.get_width()
-            start_x = label_end_x + 20  # 20px gap between label and stars
-            star_spacing = 10  # 10px spacing between stars
-
-            for i in range(score_summary["stars_count"]):
-                star_x = start_x + (scaled_star_width + star_spacing) * i
-                self.level_clear_texts.append((scaled_star, (star_x, text_y)))
-
         # Position buttons from the bottom of the sprite
         sprite_height = self.level_clear_sprite.get_height()
-        button_y = (
-            sprite_y + sprite_height - 50 - 100 - 75 + 50 - 25
-        )  # Position from bottom of sprite, 100 + 75 higher, then 50 down, then 25 up
+        # Position from bottom of sprite, 100 + 75 higher, then 50 down, 25 up
+        button_y = sprite_y + sprite_height - 50 - 100 - 75 + 50 - 25
 
-        self.restart_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (sprite_x + 50 + 100 + 50 + 25 - 10, button_y), (130, 40)
-            ),
-            text="Try Again",
-            manager=self.ui_manager,
+        self._win_restart_button = self._make_result_button(
+            (sprite_x + 50 + 100 + 50 + 25 - 10, button_y), (130, 40), "Try Again"
         )
-
-        self.continue_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (sprite_x + 200 + 100 - 50 + 20 - 10, button_y), (120, 40)
-            ),
-            text="Continue",
-            manager=self.ui_manager,
+        self._win_continue_button = self._make_result_button(
+            (sprite_x + 200 + 100 - 50 + 20 - 10, button_y), (120, 40), "Continue"
         )
-
-        self.editor_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (sprite_x + 350 + 300 - 50 + 20 - 10, button_y), (150, 40)
-            ),
-            text="Level Editor",
-            manager=self.ui_manager,
+        self._win_editor_button = self._make_result_button(
+            (sprite_x + 350 + 300 - 50 + 20 - 10, button_y),
+            (150, 40),
+            "Level Editor",
         )
+        self._win_buttons = [
+            self._win_restart_button,
+            self._win_continue_button,
+            self._win_editor_button,
+        ]
 
-        # Store position for dynamic "Push The Any Key" text
-        dummy_text = small_font.render("Push The Any Key", True, (200, 200, 200))
-        key_text_x = self.config.SCREEN_WIDTH // 2 - dummy_text.get_width() // 2
-        key_text_y = button_y + 60 - 100  # Position below buttons, moved up 100 pixels
-        self.press_key_position = (key_text_x, key_text_y)
-
-        # Make buttons transparent by overriding all appearance
-        def make_transparent(button):
-            if button:
-                # Create a fully transparent surface for the button background
-                transparent_bg = pygame.Surface(
-                    (button.rect.width, button.rect.height), pygame.SRCALPHA
-                )
-                transparent_bg.fill((0, 0, 0, 0))
-                button.set_image(transparent_bg)
-
-                # Override text color to white
-                button.text_colour = pygame.Color(255, 255, 255, 255)
-
-                # Disable the default button appearance completely
-                button.shape = "rectangle"
-                button.colours = button.colours.copy()
-                # Set all background colors to transparent
-                for key in button.colours:
-                    if "bg" in key:
-                        button.colours[key] = pygame.Color(0, 0, 0, 0)
-                    elif "border" in key:
-                        button.colours[key] = pygame.Color(0, 0, 0, 0)
-                    elif "text" in key:
-                        button.colours[key] = pygame.Color(255, 255, 255, 255)
-
-                button.rebuild()
-
-        make_transparent(self.restart_button)
-        make_transparent(self.continue_button)
-        make_transparent(self.editor_button)
+        # Position for dynamic "Push The Any Key" text
+        key_text_rect = self.press_key_font.get_rect("Push The Any Key")
+        key_text_x = self.config.SCREEN_WIDTH // 2 - key_text_rect.width // 2
+        key_text_y = button_y + 60 - 100  # Below buttons, moved up 100 pixels
+        self._press_key_pos = (key_text_x, key_text_y)
+
+    def _build_game_over_buttons(self):
+        """Lay out the game over screen and create its buttons on first show"""
+        if self._game_over_buttons:
+            return
 
-    def show_game_over_screen(self, score_system: ScoreSystem):
-        """Show game over screen"""
         # Position sprite in center of screen
         sprite_x = (
             self.config.SCREEN_WIDTH // 2 - self.game_over_sprite.get_width() // 2
@@ -551,7 +702,7 @@ class UI:
         sprite_y = (
             self.config.SCREEN_HEIGHT // 2 - self.game_over_sprite.get_height() // 2
         )
-        self.game_over_sprite_rect = pygame.Rect(
+        self._game_over_rect = pygame.Rect(
             sprite_x,
             sprite_y,
             self.game_over_sprite.get_width(),
@@ -560,55 +711,133 @@ class UI:
 
         # Position buttons from the bottom of the sprite
         sprite_height = self.game_over_sprite.get_height()
-        button_y = (
-            sprite_y + sprite_height - 50 - 100 - 75 + 50 - 25
-        )  # Position from bottom of sprite, 100 + 75 higher, then 50 down, then 25 up
+        # Position from bottom of sprite, 100 + 75 higher, then 50 down, 25 up
+        button_y = sprite_y + sprite_height - 50 - 100 - 75 + 50 - 25
 
-        self.restart_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (sprite_x + 50 + 100 + 50 + 25 - 10, button_y), (130, 40)
-            ),
-            text="Try Again",
-            manager=self.ui_manager,
+        self._game_over_restart_button = self._make_result_button(
+            (sprite_x + 50 + 100 + 50 + 25 - 10, button_y), (130, 40), "Try Again"
         )
-
-        self.restart_level_1_button = pygame_gui.elements.UIButton(
-            relative_rect=pygame.Rect(
-                (sprite_x + 250 + 300 - 50 + 20 - 10, button_y), (150, 40)
-            ),
-            text="Restart",
-            manager=self.ui_manager,
+        self._game_over_restart_level_1_button = self._make_result_button(
+            (sprite_x + 250 + 300 - 50 + 20 - 10, button_y), (150, 40), "Restart"
         )
+        self._game_over_buttons = [
+            self._game_over_restart_button,
+            self._game_over_restart_level_1_button,
+        ]
 
-        # Make buttons transparent by overriding all appearance
-        def make_transparent(button):
-            if button:
-                # Create a fully transparent surface for the button background
-                transparent_bg = pygame.Surface(
-                    (button.rect.width, button.rect.height), pygame.SRCALPHA
-                )
-                transparent_bg.fill((0, 0, 0, 0))
-                button.set_image(transparent_bg)
+    def show_win_screen(self, score_system: ScoreSystem):
+        """Show victory screen with level clear sprite and overlaid text"""
+        self.load_result_sprites()
+        self._build_win_buttons()
+        score_summary = score_system.get_score_summary()
 
-                # Override text color to white
-                button.text_colour = pygame.Color(255, 255, 255, 255)
+        self.level_clear_sprite_rect = self._level_clear_rect
+
+        self.level_clear_texts = self._build_win_texts(score_summary)
+
+        # Store position for dynamic "Push The Any Key" text
+        self.press_key_position = self._press_key_pos
 
-                # Disable the default button appearance completely
-                button.shape = "rectangle"
-                button.colours = button.colours.copy()
-                # Set all background colors to transparent
-                for key in button.colours:
-                    if "bg" in key:
-                        button.colours[key] = pygame.Color(0, 0, 0, 0)
-                    elif "border" in key:
-                        button.colours[key] = pygame.Color(0, 0, 0, 0)
-                    elif "text" in key:
-                        button.colours[key] = pygame.Color(255, 255, 255, 255)
+        # Reveal the buttons
+        self.restart_button = self._win_restart_button
+        self.continue_button = self._win_continue_button
+        self.editor_button = self._win_editor_button
+        for button in self._win_buttons:
+            button.show()
 
-                button.rebuild()
+    def _build_win_texts(self, score_summary: Dict[str, Any]) -> list:
+        """Render the win screen's score details and stars as a blit sequence
 
-        make_transparent(self.restart_button)
-        make_transparent(self.restart_level_1_button)
+        Everything is rasterized into one panel, so the overlay costs a single
+        blit per frame.
+        """
+        sprite_y = self._level_clear_rect.y
+
+        # Score details - position them in the middle of the sprite
+        font = self.press_key_font  # medium freetype font, as for the prompts
+        details = [
+            f"Time: {score_summary['time']}",
+            f"Mask Uses: {score_summary['mask_uses']}",
+            f"Rating: {score_summary['rating']}",
+        ]
+        line_spacing = 35
+        text_height = font.get_sized_height()
+        center_x = self.config.SCREEN_WIDTH // 2
+        top = sprite_y + self.level_clear_sprite.get_height() // 2 - 40
+
+        # Lay out every text item and star in screen coordinates first
+        text_items = []
+        for i, detail in enumerate(details):
+            detail_width = font.get_rect(detail).width
+            text_items.append(
+                (detail, center_x - detail_width // 2, top + line_spacing * i)
+            )
+        bottom = top + line_spacing * (len(details) - 1) + text_height
+
+        star_items = []
+        if self.star_sprite_loaded and score_summary["stars_count"] > 0:
+            # "Stars:" label followed by the stars, one line below the details
+            stars_y = top + line_spacing * len(details)
+            label_width = font.get_rect("Stars:").width
+            label_x = center_x - label_width // 2 - 50
+            text_items.append(("Stars:", label_x, stars_y))
+
+            scaled_star = self._get_scaled_star(text_height)
+            start_x = label_x + label_width + 20  # 20px gap between label and stars
+            star_spacing = 10  # 10px spacing between stars
+            for i in range(score_summary["stars_count"]):
+                star_x = start_x + (scaled_star.get_width() + star_spacing) * i
+                star_items.append((scaled_star, star_x, stars_y))
+            bottom = stars_y + text_height
+
+        left = min(x for _, x, _ in text_items)
+        right = max(x + font.get_rect(text).width for text, x, _ in text_items)
+        for star, star_x, _ in star_items:
+            right = max(right, star_x + star.get_width())
+
+        panel = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        for text, x, y in text_items:
+            font.render_to(panel, (x - left, y - top), text, fgcolor=(255, 255, 255))
+        for star, x, y in star_items:
+            # Stars don't overlap the text, so RGBA_MAX copies their pixels
+            # as-is instead of blending them against the empty panel
+            panel.blit(star, (x - left, y - top), special_flags=pygame.BLEND_RGBA_MAX)
+
+        return [(_to_display_format(panel), (left, top))]
+
+    def _get_scaled_star(self, text_height: int) -> pygame.Surface:
+        """Get the star sprite scaled to match the given text height"""
+        scaled_star = _SCALED_STAR_CACHE.get(text_height)
+        if scaled_star is None:
+            star_width = self.star_sprite.get_width()
+            star_height = self.star_sprite.get_height()
+
+            # Scale to match text height while maintaining aspect ratio
+            scale_factor = text_height / star_height
+            scaled_star_width = int(star_width * scale_factor)
+            scaled_star_height = text_height
+
+            # The star already carries per-pixel alpha, so scaling keeps the
+            # background transparent
+            scaled_star = _to_display_format(
+                pygame.transform.scale(
+                    self.star_sprite, (scaled_star_width, scaled_star_height)
+                )
+            )
+            _SCALED_STAR_CACHE[text_height] = scaled_star
+        return scaled_star
+
+    def show_game_over_screen(self, score_system: ScoreSystem):
+        """Show game over screen"""
+        self.load_result_sprites()
+        self._build_game_over_buttons()
+        self.game_over_sprite_rect = self._game_over_rect
+
+        # Reveal the buttons
+        self.restart_button = self._game_over_restart_button
+        self.restart_level_1_button = self._game_over_restart_level_1_button
+        for button in self._game_over_buttons:
+            button.show()
 
     def hide_result_screen(self):
         """Hide result screen elements"""
@@ -618,27 +847,18 @@ class UI:
             self.win_text = None
             self.game_over_text = None
 
-        # Kill individual buttons
-        if self.restart_button:
-            self.restart_button.kill()
-            self.restart_button = None
-        if self.restart_level_1_button:
-            self.restart_level_1_button.kill()
-            self.restart_level_1_button = None
-        if self.continue_button:
-            self.continue_button.kill()
-            self.continue_button = None
-        if self.editor_button:
-            self.editor_button.kill()
-            self.editor_button = None
+        # Hide the result screen buttons; cleanup() kills them with the UI
+        for button in self._win_buttons + self._game_over_buttons:
+            button.hide()
+        self.restart_button = None
+        self.restart_level_1_button = None
+        self.continue_button = None
+        self.editor_button = None
 
         # Clean up sprite-related attributes and text
-        if hasattr(self, "game_over_sprite_rect"):
-            delattr(self, "game_over_sprite_rect")
-        if hasattr(self, "level_clear_sprite_rect"):
-            delattr(self, "level_clear_sprite_rect")
-        if hasattr(self, "press_key_position"):
-            delattr(self, "press_key_position")
+        self.game_over_sprite_rect = None
+        self.level_clear_sprite_rect = None
+        self.press_key_position = None
         self.level_clear_texts = []
 
     def cleanup(self):
@@ -661,6 +881,10 @@ class UI:
 
         # Kill result screen elements
         self.hide_result_screen()
+        for button in self._win_buttons + self._game_over_buttons:
+            button.kill()
+        self._win_buttons = []
+        self._game_over_buttons = []
 
     def handle_ui_events(self, event):
         """Handle UI-specific events"""
@@ -684,9 +908,7 @@ class UI:
                 elif self.editor_button and event.ui_element == self.editor_button:
                     logger.info("Level Editor button clicked")
                     # Trigger level editor (handled in main game loop)
-                    pygame.event.post(
-                        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_e)
-                    )
+                    pygame.event.post(pygame.event.Event(OPEN_EDITOR_EVENT))
 
     def update_from_level_config(self, level_config: Dict[str, Any]):
         """Update UI elements based on level configuration"""
@@ -695,11 +917,29 @@ class UI:
 
     def render_debug_info(self, screen: pygame.Surface, debug_info: Dict[str, Any]):
         """Render debug information (for development)"""
-        font = self.config.get_font("small")
-        y_offset = 80
+        cache = self._debug_text_cache
+        if len(cache) > 256:
+            cache.clear()
+
+        # Row positions only depend on the row count, so build them once
+        positions = self._debug_row_positions
+        while len(positions) < len(debug_info):
+            positions.append((10, 80 + 20 * len(positions)))
+
+        font = None
+        blit_sequence = []
 
-        for key, value in debug_info.items():
+        for (key, value), position in zip(debug_info.items(), positions):
             text = f"{key}: {value}"
-            text_surface = font.render(text, True, (255, 255, 255))
-            screen.blit(text_surface, (10, y_offset))
-            y_offset += 20
+            text_surface = cache.get(text)
+            if text_surface is None:
+                if font is None:
+                    font = self.config.get_font("small")
+                text_surface = _to_display_format(
+                    font.render(text, True, (255, 255, 255))
+                )
+                cache[text] = text_surface
+            blit_sequence.append((text_surface, position))
+
+        # Draw all rows with a single blits() call
+        screen.blits(blit_sequence, doreturn=0)
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pygame
+import pygame_gui
+import pytest
+
+from src.the_floor_is_a_lie.config import Config
+from src.the_floor_is_a_lie.tile import Tile
+
+
+@pytest.fixture(scope="session")
+def shared_config():
+    """A single Config shared by every test; tests must not mutate it."""
+    return Config()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame_display():
+    """Create the pygame display once for the session and quit at the end."""
+    if not pygame.get_init():
+        pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def ui_manager(shared_config, _pygame_display):
+    """A single UIManager shared by the UI tests, so the theme loads once."""
+    return pygame_gui.UIManager(
+        (shared_config.SCREEN_WIDTH, shared_config.SCREEN_HEIGHT)
+    )
+
+
+def _build_grid(config, types):
+    """Build a tile grid from rows of TileTypes, indexed as grid[y][x]."""
+    return [
+        [Tile(config, tile_type, (x, y)) for x, tile_type in enumerate(row)]
+        for y, row in enumerate(types)
+    ]
+
+
+@pytest.fixture
+def build_grid():
+    """Factory fixture for building tile grids from rows of TileTypes."""
+    return _build_grid
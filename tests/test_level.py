@@ -1,20 +1,54 @@
 """Tests for the Level module."""
 
 import json
-import os
-import tempfile
 
-from src.the_floor_is_a_lie.config import Config
+import pytest
+
 from src.the_floor_is_a_lie.level import Level
-from src.the_floor_is_a_lie.tile import TileType
+from src.the_floor_is_a_lie.tile import Tile, TileType
+
+SAMPLE_LEVEL_DATA = {
+    "name": "Test Level",
+    "grid": [["start", "real", "fake"], ["real", "empty", "exit"]],
+    "config": {
+        "mask_duration": 3.0,
+        "mask_cooldown": 4.0,
+        "time_thresholds": [20, 40, 80],
+        "mask_threshold": 3,
+    },
+}
+# Serialized once at import; the data never changes
+SAMPLE_LEVEL_JSON = json.dumps(SAMPLE_LEVEL_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_level_path(tmp_path_factory):
+    """Write the sample level file once for the whole session."""
+    path = tmp_path_factory.mktemp("levels") / "test_level.json"
+    path.write_text(SAMPLE_LEVEL_JSON)
+    return path
+
+
+@pytest.fixture(scope="module")
+def loaded_level(shared_config, sample_level_path):
+    """The sample level loaded once per module; tests must treat it as read-only.
+
+    Grid layout (x across, y down):
+        y=0: start real  fake
+        y=1: real  empty exit
+    """
+    level = Level(shared_config)
+    assert level.load_level(str(sample_level_path))
+    return level
 
 
 class TestLevel:
     """Test cases for Level class."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_config):
         """Set up test fixtures."""
-        self.config = Config()
+        self.config = shared_config
         self.level = Level(self.config)
 
     def test_initialization(self):
@@ -22,186 +56,166 @@ class TestLevel:
         assert self.level.name == "Default Level"
         assert len(self.level.grid) == 0  # Empty until loaded
 
-    def test_load_level_success(self):
+    def test_load_level_success(self, sample_level_path):
         """Test successful level loading."""
-        # Create a temporary level file
-        level_data = {
-            "name": "Test Level",
-            "grid": [["start", "real", "fake"], ["real", "empty", "exit"]],
-            "config": {
-                "mask_duration": 3.0,
-                "mask_cooldown": 4.0,
-                "time_thresholds": [20, 40, 80],
-                "mask_threshold": 3,
-            },
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(level_data, f)
-            temp_path = f.name
-
-        try:
-            # Load the level
-            success = self.level.load_level(temp_path)
-            assert success
-
-            # Check level properties
-            assert self.level.name == "Test Level"
-            assert len(self.level.grid) == 2
-            assert len(self.level.grid[0]) == 3
-            assert self.level.start_pos == (0, 0)
-            assert self.level.exit_pos == (2, 1)
-
-            # Check configuration
-            assert self.level.mask_duration == 3.0
-            assert self.level.mask_cooldown == 4.0
-            assert self.level.time_thresholds == [20, 40, 80]
-            assert self.level.mask_threshold == 3
-
-        finally:
-            os.unlink(temp_path)
+        # Load the level
+        success = self.level.load_level(str(sample_level_path))
+        assert success
+
+        # Check level properties
+        assert self.level.name == "Test Level"
+        assert len(self.level.grid) == 2
+        assert len(self.level.grid[0]) == 3
+        assert self.level.start_pos == (0, 0)
+        assert self.level.exit_pos == (2, 1)
+
+        # Check configuration
+        assert self.level.mask_duration == 3.0
+        assert self.level.mask_cooldown == 4.0
+        assert self.level.time_thresholds == [20, 40, 80]
+        assert self.level.mask_threshold == 3
 
     def test_load_level_invalid_file(self):
         """Test loading invalid level file."""
         success = self.level.load_level("nonexistent.json")
         assert not success
 
-    def test_save_level(self):
-        """Test level saving."""
-        # Set up a level
+    def _set_up_save_test_level(self, build_grid):
+        """Set up a small level to save."""
         self.level.name = "Save Test"
         self.level.start_pos = (0, 0)
         self.level.exit_pos = (2, 2)
 
         # Create a simple grid
-        from src.the_floor_is_a_lie.tile import Tile
-
-        self.level.grid = [
-            [
-                Tile(self.config, TileType.START, (0, 0)),
-                Tile(self.config, TileType.REAL, (1, 0)),
-                Tile(self.config, TileType.FAKE, (2, 0)),
-            ],
-            [
-                Tile(self.config, TileType.REAL, (0, 1)),
-                Tile(self.config, TileType.EMPTY, (1, 1)),
-                Tile(self.config, TileType.REAL, (2, 1)),
-            ],
+        self.level.grid = build_grid(
+            self.config,
             [
-                Tile(self.config, TileType.FAKE, (0, 2)),
-                Tile(self.config, TileType.REAL, (1, 2)),
-                Tile(self.config, TileType.EXIT, (2, 2)),
+                [TileType.START, TileType.REAL, TileType.FAKE],
+                [TileType.REAL, TileType.EMPTY, TileType.REAL],
+                [TileType.FAKE, TileType.REAL, TileType.EXIT],
             ],
-        ]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Save the level
-            success = self.level.save_level(temp_path)
-            assert success
+        )
 
-            # Load it back and verify
-            new_level = Level(self.config)
-            success = new_level.load_level(temp_path)
-            assert success
-            assert new_level.name == "Save Test"
-            assert new_level.start_pos == (0, 0)
-            assert new_level.exit_pos == (2, 2)
-
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-
-    def test_valid_position(self):
+    def test_save_level(self, build_grid, tmp_path):
+        """Test level saving."""
+        self._set_up_save_test_level(build_grid)
+        temp_path = tmp_path / "save_test.json"
+
+        # Save the level
+        success = self.level.save_level(str(temp_path))
+        assert success
+
+        # Check the written file directly
+        data = json.loads(temp_path.read_text())
+        assert data["name"] == "Save Test"
+        assert data["grid"] == [
+            ["start", "real", "fake"],
+            ["real", "empty", "real"],
+            ["fake", "real", "exit"],
+        ]
+        assert data["config"]["mask_duration"] == self.level.mask_duration
+        assert data["config"]["mask_threshold"] == self.level.mask_threshold
+
+    def test_save_then_load_roundtrip(self, build_grid, tmp_path):
+        """Test that a saved level loads back with the same properties."""
+        self._set_up_save_test_level(build_grid)
+        temp_path = str(tmp_path / "save_test.json")
+        assert self.level.save_level(temp_path)
+
+        # Load it back and verify
+        new_level = Level(self.config)
+        success = new_level.load_level(temp_path)
+        assert success
+        assert new_level.name == "Save Test"
+        assert new_level.start_pos == (0, 0)
+        assert new_level.exit_pos == (2, 2)
+
+    def test_valid_position(self, loaded_level):
         """Test position validation."""
-        # Create a small grid
-        self.level.grid = [[None, None], [None, None]]
-
-        assert self.level.is_valid_position((0, 0))
-        assert self.level.is_valid_position((1, 1))
-        assert not self.level.is_valid_position((-1, 0))
-        assert not self.level.is_valid_position((2, 0))
-        assert not self.level.is_valid_position((0, 2))
-
-    def test_walkable_tiles(self):
+        assert loaded_level.is_valid_position((0, 0))
+        assert loaded_level.is_valid_position((2, 1))
+        assert not loaded_level.is_valid_position((-1, 0))
+        assert not loaded_level.is_valid_position((3, 0))
+        assert not loaded_level.is_valid_position((0, 2))
+
+    @pytest.mark.parametrize(
+        "pos, mask_active, expected",
+        [
+            ((1, 0), False, True),  # Real tile
+            ((2, 0), False, True),  # Fake tile is walkable (but deadly)
+            ((1, 1), False, False),  # Empty tile
+            ((0, 0), False, True),  # Start tile
+            ((1, 0), True, True),  # Real tile
+            ((2, 0), True, True),  # Fake tile with mask
+            ((1, 1), True, False),  # Empty tile still dangerous
+        ],
+    )
+    def test_walkable_tiles(self, loaded_level, pos, mask_active, expected):
         """Test tile walkability logic."""
-        from src.the_floor_is_a_lie.tile import Tile
-
-        # Create tiles
-        real_tile = Tile(self.config, TileType.REAL, (0, 0))
-        fake_tile = Tile(self.config, TileType.FAKE, (1, 0))
-        empty_tile = Tile(self.config, TileType.EMPTY, (2, 0))
-        start_tile = Tile(self.config, TileType.START, (0, 1))
-
-        # Set up level grid
-        self.level.grid = [[real_tile, fake_tile, empty_tile], [start_tile, None, None]]
-
-        # Test walkability without mask
-        assert self.level.is_walkable((0, 0), False)  # Real tile
-        assert self.level.is_walkable(
-            (1, 0), False
-        )  # Fake tile is walkable (but deadly)
-        assert not self.level.is_walkable((2, 0), False)  # Empty tile
-        assert self.level.is_walkable((0, 1), False)  # Start tile
-
-        # Test walkability with mask
-        assert self.level.is_walkable((0, 0), True)  # Real tile
-        assert self.level.is_walkable((1, 0), True)  # Fake tile with mask
-        assert not self.level.is_walkable((2, 0), True)  # Empty tile still dangerous
-
-    def test_safe_tiles(self):
+        assert loaded_level.is_walkable(pos, mask_active) == expected
+
+    @pytest.mark.parametrize(
+        "pos, mask_active, expected",
+        [
+            ((1, 0), False, True),  # Real tile is safe
+            ((2, 0), False, False),  # Fake tile dangerous
+            ((1, 1), False, False),  # Empty tile dangerous
+            ((1, 0), True, True),  # Real tile still safe
+            ((2, 0), True, False),  # Fake tile never safe
+            ((1, 1), True, False),  # Empty tile still dangerous
+        ],
+    )
+    def test_safe_tiles(self, loaded_level, pos, mask_active, expected):
         """Test tile safety logic."""
-        from src.the_floor_is_a_lie.tile import Tile
+        assert loaded_level.is_safe(pos, mask_active) == expected
 
-        # Create tiles
-        real_tile = Tile(self.config, TileType.REAL, (0, 0))
-        fake_tile = Tile(self.config, TileType.FAKE, (1, 0))
-        empty_tile = Tile(self.config, TileType.EMPTY, (2, 0))
-
-        # Set up level grid
-        self.level.grid = [[real_tile, fake_tile, empty_tile]]
-
-        # Test safety without mask
-        assert self.level.is_safe((0, 0), False)  # Real tile is safe
-        assert not self.level.is_safe((1, 0), False)  # Fake tile dangerous without mask
-        assert not self.level.is_safe((2, 0), False)  # Empty tile dangerous
-
-        # Test safety with mask
-        assert self.level.is_safe((0, 0), True)  # Real tile still safe
-        assert not self.level.is_safe((1, 0), True)  # Fake tile never safe
-        assert not self.level.is_safe((2, 0), True)  # Empty tile still dangerous
-
-    def test_exit_detection(self):
+    def test_exit_detection(self, loaded_level):
         """Test exit tile detection."""
-        self.level.exit_pos = (2, 1)
-
-        assert self.level.is_exit_tile((2, 1))
-        assert not self.level.is_exit_tile((0, 0))
-        assert not self.level.is_exit_tile((1, 1))
+        assert loaded_level.is_exit_tile((2, 1))
+        assert not loaded_level.is_exit_tile((0, 0))
+        assert not loaded_level.is_exit_tile((1, 1))
 
-    def test_set_tile_type(self):
+    def test_set_tile_type(self, tmp_path):
         """Test changing tile types."""
-        from src.the_floor_is_a_lie.tile import Tile
+        temp_path = tmp_path / "set_tile_type.json"
+
+        def saved_type():
+            assert self.level.save_level(str(temp_path))
+            return json.loads(temp_path.read_text())["grid"][0][0]
 
         # Create initial tile
         initial_tile = Tile(self.config, TileType.REAL, (0, 0))
         self.level.grid = [[initial_tile]]
 
-        # Change to fake
+        # Change to fake; the tile queries and the saved file follow it
         self.level.set_tile_type((0, 0), TileType.FAKE)
         assert self.level.grid[0][0].type == TileType.FAKE
+        assert self.level.is_walkable((0, 0))
+        assert not self.level.is_safe((0, 0))
+        assert self.level.is_fake_tile((0, 0))
+        assert saved_type() == "fake"
 
         # Change to start (should update start_pos)
         self.level.set_tile_type((0, 0), TileType.START)
         assert self.level.grid[0][0].type == TileType.START
         assert self.level.start_pos == (0, 0)
+        assert self.level.is_safe((0, 0))
+        assert not self.level.is_fake_tile((0, 0))
+        assert saved_type() == "start"
 
         # Change start to exit (should update exit_pos)
         self.level.set_tile_type((0, 0), TileType.EXIT)
         assert self.level.grid[0][0].type == TileType.EXIT
         assert self.level.exit_pos == (0, 0)
+        assert self.level.is_exit_tile((0, 0))
+        assert saved_type() == "exit"
+
+        # Change to empty
+        self.level.set_tile_type((0, 0), TileType.EMPTY)
+        assert self.level.grid[0][0].type == TileType.EMPTY
+        assert not self.level.is_walkable((0, 0))
+        assert self.level.is_empty_tile((0, 0))
+        assert saved_type() == "empty"
 
     def test_level_info(self):
         """Test getting level information."""
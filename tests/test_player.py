@@ -1,17 +1,24 @@
 """Tests for the Player module."""
 
 import pygame
+import pygame_gui
+import pytest
 
-from src.the_floor_is_a_lie.config import Config
+from src.the_floor_is_a_lie.game import Game
 from src.the_floor_is_a_lie.player import Player
+from src.the_floor_is_a_lie.score import ScoreSystem
+from src.the_floor_is_a_lie.ui import RESTART_GAME_EVENT, UI
 
-# Initialize pygame for testing
-pygame.init()
+K_RIGHT = pygame.K_RIGHT
+K_M = pygame.K_m
+K_R = pygame.K_r
 
 
 class KeyState:
     """Efficient key state mock that behaves like a list but uses a dict internally"""
 
+    __slots__ = ("_pressed",)
+
     def __init__(self, pressed_keys=None):
         self._pressed = set(pressed_keys or [])
 
@@ -28,9 +35,10 @@ class KeyState:
 class TestPlayer:
     """Test cases for Player class."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_config):
         """Set up test fixtures."""
-        self.config = Config()
+        self.config = shared_config
         self.start_pos = (1, 1)
         self.player = Player(self.config, self.start_pos)
 
@@ -121,7 +129,7 @@ class TestPlayer:
     def test_input_handling_movement(self):
         """Test keyboard input handling for movement."""
         # Mock key states using efficient KeyState
-        keys = KeyState([pygame.K_RIGHT])
+        keys = KeyState([K_RIGHT])
 
         # Handle input
         self.player.handle_input(keys)
@@ -131,9 +139,8 @@ class TestPlayer:
 
     def test_input_handling_mask_toggle(self):
         """Test that input handling doesn't interfere with mask toggle."""
-        keys = KeyState(
-            [pygame.K_m]
-        )  # This should be handled by main game loop, not player
+        # This should be handled by main game loop, not player
+        keys = KeyState([K_M])
 
         # Handle input (should not affect mask)
         initial_mask_state = self.player.mask_active
@@ -146,8 +153,16 @@ class TestPlayer:
         """Test player reset functionality."""
         # Move player and use mask
         self.player.move_to_grid(5, 5)
-        for _ in range(10):
-            self.player.update(1.0 / 60)
+
+        # Complete movement instantly for testing
+        new_pos = (5, 5)
+        target_x, target_y = self.config.get_grid_center(new_pos)
+        self.player.x, self.player.y = target_x, target_y
+        self.player.grid_x, self.player.grid_y = new_pos
+        self.player.target_grid_pos = None
+        self.player.moving = False
+        self.player.velocity_x = 0
+        self.player.velocity_y = 0
 
         self.player.toggle_mask()
         self.player.toggle_mask()  # Deactivate
@@ -176,111 +191,73 @@ class TestPlayer:
             "uses",
         ]
         for key in expected_keys:
-            assert key in status
+            assert hasattr(status, key)
 
-    def test_restart_functionality(self):
+    def test_restart_functionality(self, ui_manager):
         """Test that restart functionality works properly in game over state."""
-        import pygame
-        import pygame_gui
-
-        from src.the_floor_is_a_lie.game import Game
-        from src.the_floor_is_a_lie.ui import UI
-
-        # Initialize pygame for testing
-        pygame.init()
-        pygame.display.set_mode((800, 600))
-
-        try:
-            # Create a minimal game instance for testing
-            config = self.config
-            ui_manager = pygame_gui.UIManager(
-                (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-            )
-            game = Game()
-            game.ui = UI(config, ui_manager)
-
-            # Set game to game_over state
-            game.game_state = "game_over"
-
-            # Simulate pressing the restart key (like the UI button does)
-            restart_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
-
-            # Process the event (simulate what happens in the main loop)
-            if restart_event.type == pygame.KEYDOWN and restart_event.key == pygame.K_r:
-                if game.game_state == "game_over":
-                    game.restart_game()
-
-            # Check that game state changed back to playing
-            assert (
-                game.game_state == "playing"
-            ), f"Expected playing state, got {game.game_state}"
-
-            # Check that game was reinitialized
-            assert (
-                game.player is not None
-            ), "Player should be reinitialized after restart"
-            assert game.level is not None, "Level should be reinitialized after restart"
-            assert (
-                game.score_system is not None
-            ), "Score system should be reinitialized after restart"
-
-            # Check that player stats were reset
-            assert game.player.mask_uses == 0, "Player mask uses should be reset"
-            assert (
-                not game.player.mask_active
-            ), "Player mask should not be active after restart"
-
-        finally:
-            pygame.quit()
-
-    def test_restart_button_triggers_event(self):
+        # Create a minimal game instance for testing
+        config = self.config
+        game = Game()
+        game.ui = UI(config, ui_manager)
+
+        # Set game to game_over state
+        game.game_state = "game_over"
+
+        # Simulate pressing the restart key (like the UI button does)
+        restart_event = pygame.event.Event(pygame.KEYDOWN, key=K_R)
+
+        # Process the event (simulate what happens in the main loop)
+        if restart_event.type == pygame.KEYDOWN and restart_event.key == K_R:
+            if game.game_state == "game_over":
+                game.restart_game()
+
+        # Check that game state changed back to playing
+        assert (
+            game.game_state == "playing"
+        ), f"Expected playing state, got {game.game_state}"
+
+        # Check that game was reinitialized
+        assert game.player is not None, "Player should be reinitialized after restart"
+        assert game.level is not None, "Level should be reinitialized after restart"
+        assert (
+            game.score_system is not None
+        ), "Score system should be reinitialized after restart"
+
+        # Check that player stats were reset
+        assert game.player.mask_uses == 0, "Player mask uses should be reset"
+        assert (
+            not game.player.mask_active
+        ), "Player mask should not be active after restart"
+
+    def test_restart_button_triggers_event(self, ui_manager):
         """Test that clicking restart button triggers the correct event."""
-        import pygame
-        import pygame_gui
-
-        from src.the_floor_is_a_lie.score import ScoreSystem
-        from src.the_floor_is_a_lie.ui import RESTART_GAME_EVENT, UI
-
-        # Initialize pygame for testing
-        pygame.init()
-        pygame.display.set_mode((800, 600))
-
-        try:
-            # Create UI instance
-            config = self.config
-            ui_manager = pygame_gui.UIManager(
-                (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-            )
-            ui = UI(config, ui_manager)
-
-            # Create score system for testing
-            score = ScoreSystem(config)
-
-            # Show game over screen
-            ui.show_game_over_screen(score)
-
-            # Verify result panel exists
-            assert (
-                ui.result_panel is not None
-            ), "Result panel should exist after showing game over screen"
-            assert ui.restart_button is not None, "Restart button should exist"
-
-            # Clear any existing events
-            pygame.event.clear()
-
-            # Simulate clicking the restart button
-            restart_button_event = pygame_gui.UI_BUTTON_PRESSED
-            button_event = pygame.event.Event(
-                restart_button_event, ui_element=ui.restart_button
-            )
-            ui.handle_ui_events(button_event)
-
-            # Check that the restart event was posted
-            events = pygame.event.get()
-            restart_events = [e for e in events if e.type == RESTART_GAME_EVENT]
-            assert (
-                len(restart_events) == 1
-            ), f"Expected 1 RESTART_GAME_EVENT, got {len(restart_events)}"
-
-        finally:
-            pygame.quit()
+        # Create UI instance
+        config = self.config
+        ui = UI(config, ui_manager)
+
+        # Create score system for testing
+        score = ScoreSystem(config)
+
+        # Show game over screen
+        ui.show_game_over_screen(score)
+
+        # The game over screen is drawn from a sprite, not a result panel;
+        # only its buttons are UI elements
+        assert ui.restart_button is not None, "Restart button should exist"
+        assert ui.restart_button.visible, "Restart button should be shown"
+
+        # Clear any existing events
+        pygame.event.clear()
+
+        # Simulate clicking the restart button
+        restart_button_event = pygame_gui.UI_BUTTON_PRESSED
+        button_event = pygame.event.Event(
+            restart_button_event, ui_element=ui.restart_button
+        )
+        ui.handle_ui_events(button_event)
+
+        # Check that the restart event was posted
+        restart_events = pygame.event.get(RESTART_GAME_EVENT)
+        assert (
+            len(restart_events) == 1
+        ), f"Expected 1 RESTART_GAME_EVENT, got {len(restart_events)}"
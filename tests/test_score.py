@@ -1,15 +1,17 @@
 """Tests for the Score module."""
 
-from src.the_floor_is_a_lie.config import Config
+import pytest
+
 from src.the_floor_is_a_lie.score import ScoreSystem
 
 
 class TestScoreSystem:
     """Test cases for ScoreSystem class."""
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_config):
         """Set up test fixtures."""
-        self.config = Config()
+        self.config = shared_config
         self.score = ScoreSystem(self.config)
 
     def test_initialization(self):
@@ -23,13 +25,11 @@ class TestScoreSystem:
 
     def test_time_tracking(self):
         """Test elapsed time tracking."""
-        # Update for 5 seconds
-        for _ in range(300):  # 5 seconds at 60 FPS
-            self.score.update(1.0 / 60)
+        # Update for 5 seconds in two steps
+        self.score.update(2.0)
+        self.score.update(3.0)
 
-        assert (
-            abs(self.score.elapsed_time - 5.0) < 0.1
-        )  # Allow small floating point error
+        assert self.score.elapsed_time == 5.0
 
     def test_mask_usage_tracking(self):
         """Test mask usage counting."""